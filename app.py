@@ -6,15 +6,19 @@
 import os
 import re
 import json
+import hashlib
 import calendar
 import datetime as dt
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, List, Tuple
 
 import streamlit as st
-import pandas as pd
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Boolean, Date, Text, DateTime, ForeignKey
+    create_engine, Column, Integer, String, Boolean, Date, Text, DateTime, ForeignKey,
+    func, case, Index, event, update, delete
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
 # Optional rich editor for the Notebook tab
@@ -23,13 +27,62 @@ try:
 except Exception:
     st_quill = None
 
+# Optional fast JSON codec for Quill deltas (falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except Exception:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 APP_TITLE = "BlueNest 💙"
 DEFAULT_USERS = ["Ravi", "Amitha"]
 
 # ---------- Database ----------
 DB_PATH = os.environ.get("BLUENEST_DB", "bluenest.db")
-engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(bind=engine)
+
+def _sqlite_pragmas(dbapi_conn, _record):
+    """Tune SQLite for Streamlit's frequent tiny commits.
+
+    WAL + synchronous=NORMAL avoids an fsync per commit and lets readers
+    proceed alongside writers; the remaining pragmas keep temp data and
+    hot pages in memory.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+@st.cache_resource
+def get_engine():
+    """Create the SQLite engine once per process and share it across reruns"""
+    # query_cache_size comfortably covers the app's fixed set of statements
+    # so compiled SQL stays cached across reruns. The default pool stays:
+    # each Streamlit session thread needs its own connection so concurrent
+    # users' transactions don't interleave on one DBAPI handle.
+    eng = create_engine(
+        f"sqlite:///{DB_PATH}",
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,
+    )
+    # Registered here rather than at module scope: reruns re-execute the
+    # module with fresh function objects, which would pile new listeners
+    # onto the cached engine on every interaction
+    event.listen(eng, "connect", _sqlite_pragmas)
+    return eng
+
+@st.cache_resource
+def get_sessionmaker():
+    """Build the session factory once, bound to the shared engine"""
+    return sessionmaker(bind=get_engine())
+
+engine = get_engine()
+SessionLocal = get_sessionmaker()
 Base = declarative_base()
 
 class User(Base):
@@ -51,6 +104,13 @@ class Task(Base):
     priority = Column(Integer, default=0)  # New field for ordering
     auto_rollover = Column(Boolean, default=True)  # New field for rollover behavior
     user = relationship("User")
+    __table_args__ = (
+        # Composite indexes matching the hot filters: the daily task list and
+        # summarizer filter on (user_id, scope, due_date), the rollover on
+        # (user_id, scope, completed).
+        Index("ix_tasks_user_scope_due", "user_id", "scope", "due_date"),
+        Index("ix_tasks_user_scope_completed", "user_id", "scope", "completed"),
+    )
 
 class DailyNote(Base):
     """Daily notebook (Quill delta JSON) per user per date"""
@@ -59,8 +119,15 @@ class DailyNote(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     date = Column(Date, nullable=False)
     content_json = Column(Text, default="{}")  # quill delta JSON string
+    content_hash = Column(String(16))  # blake2b of content_json; skips no-op saves
     updated_at = Column(DateTime, default=dt.datetime.utcnow)
     user = relationship("User")
+    __table_args__ = (
+        # The notebook fetch filters on (user_id, date) every rerun; unique
+        # so one note per user per day is enforced by the database and the
+        # ensure-note path can rely on ON CONFLICT
+        Index("ix_daily_notes_user_date", "user_id", "date", unique=True),
+    )
 
 class VisionBoardItem(Base):
     """Vision board items with position and content type fields"""
@@ -91,14 +158,46 @@ class DashboardMetric(Base):
 
 def init_db():
     Base.metadata.create_all(engine)
+    # create_all skips new columns on pre-existing tables, so backfill
+    # content_hash for databases created before it existed
+    with engine.connect() as conn:
+        cols = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(daily_notes)")]
+        if "content_hash" not in cols:
+            conn.exec_driver_sql("ALTER TABLE daily_notes ADD COLUMN content_hash VARCHAR(16)")
+        # The note index is unique; any database that predates it (or carries
+        # the old non-unique version) may hold duplicate (user_id, date) rows
+        # from the old select-then-insert race, so collapse them — keeping
+        # the newest row — before idx.create can declare the index UNIQUE
+        note_indexes = {row[1]: row[2]
+                        for row in conn.exec_driver_sql("PRAGMA index_list(daily_notes)")}
+        if not note_indexes.get("ix_daily_notes_user_date"):
+            conn.exec_driver_sql(
+                "DELETE FROM daily_notes WHERE id NOT IN "
+                "(SELECT MAX(id) FROM daily_notes GROUP BY user_id, date)"
+            )
+            if "ix_daily_notes_user_date" in note_indexes:
+                conn.exec_driver_sql("DROP INDEX ix_daily_notes_user_date")
+        conn.commit()
+    # ...and likewise skips indexes on pre-existing tables, so create them
+    # explicitly for databases that predate the index declarations
+    for table in (Task.__table__, DailyNote.__table__):
+        for idx in table.indexes:
+            idx.create(bind=engine, checkfirst=True)
     with SessionLocal() as s:
-        if not s.query(User).count():
+        # Cheaper than COUNT(*): stops at the first row instead of scanning
+        if s.query(User.id).limit(1).first() is None:
             for n in DEFAULT_USERS:
                 s.add(User(name=n))
             s.commit()
 
+@st.cache_resource
+def _bootstrap_db() -> bool:
+    """Run init_db exactly once per process instead of on every rerun"""
+    init_db()
+    return True
+
 # Initialize database
-init_db()
+_bootstrap_db()
 
 # ---------- Dynamic Background System ----------
 def get_daily_background_theme(date: dt.date) -> str:
@@ -199,6 +298,8 @@ class TodoInterface:
             if title:
                 self._save_task(title)
                 st.session_state[key_input] = ""  # Clear input
+                # Plain rerun: on_change callbacks run before any fragment
+                # context exists, so scope="fragment" would raise here
                 st.rerun()
         
         st.markdown("<div class='todo-input'>", unsafe_allow_html=True)
@@ -223,6 +324,7 @@ class TodoInterface:
             )
             s.add(task)
             s.commit()
+        get_cached_day_summary.clear()
     
     def render_task_list(self):
         """Render task list with click-to-edit functionality"""
@@ -253,7 +355,7 @@ class TodoInterface:
             checked = st.checkbox("", value=task.completed, key=f"chk_{task.id}", label_visibility="collapsed")
             if checked != task.completed:
                 self._toggle_task_completion(task.id, checked)
-                st.rerun()
+                st.rerun(scope="fragment")
         
         with col2:
             # Task title with click-to-edit functionality
@@ -276,62 +378,68 @@ class TodoInterface:
                         if new_title.strip():
                             self._update_task_title(task.id, new_title.strip())
                         st.session_state[edit_key] = False
-                        st.rerun()
+                        st.rerun(scope="fragment")
             else:
                 # Display mode - clean task title
                 if st.button(task.title, key=f"title_{task.id}", use_container_width=True):
                     st.session_state[edit_key] = True
-                    st.rerun()
+                    st.rerun(scope="fragment")
         
         with col3:
             # Minimal delete button
             if st.button("×", key=f"del_{task.id}", help="Delete task"):
                 self._delete_task(task.id)
-                st.rerun()
+                st.rerun(scope="fragment")
         
         st.markdown("</div>", unsafe_allow_html=True)
     
     def _toggle_task_completion(self, task_id: int, completed: bool):
-        """Toggle task completion status"""
+        """Toggle task completion status with a single UPDATE (no prior SELECT)"""
         with SessionLocal() as s:
-            task = s.query(Task).get(task_id)
-            if task:
-                task.completed = completed
-                task.updated_at = dt.datetime.utcnow()
-                s.commit()
-    
+            s.execute(
+                update(Task).where(Task.id == task_id).values(
+                    completed=completed, updated_at=dt.datetime.utcnow()
+                )
+            )
+            s.commit()
+        get_cached_day_summary.clear()
+
     def _update_task_title(self, task_id: int, new_title: str):
-        """Update task title"""
+        """Update task title with a single UPDATE (no prior SELECT)"""
         with SessionLocal() as s:
-            task = s.query(Task).get(task_id)
-            if task:
-                task.title = new_title
-                task.updated_at = dt.datetime.utcnow()
-                s.commit()
+            s.execute(
+                update(Task).where(Task.id == task_id).values(
+                    title=new_title, updated_at=dt.datetime.utcnow()
+                )
+            )
+            s.commit()
+        get_cached_day_summary.clear()
     
     def _delete_task(self, task_id: int):
         """Delete task"""
         with SessionLocal() as s:
-            task = s.query(Task).get(task_id)
+            task = s.get(Task, task_id)
             if task:
                 s.delete(task)
                 s.commit()
+        get_cached_day_summary.clear()
     
     def _check_and_trigger_rollover(self):
         """Check if rollover should be triggered for this user and date"""
+        today = dt.date.today()
         # Only trigger rollover if viewing today's date or future dates
-        if self.date >= dt.date.today():
+        if self.date >= today:
             # Check if we need to process rollover for this user
             last_rollover_key = f"last_rollover_{self.user_id}"
-            
+
             # Use session state to track last rollover date to avoid repeated processing
             if last_rollover_key not in st.session_state:
                 st.session_state[last_rollover_key] = None
-            
+
             # Only process rollover once per day per user
-            if st.session_state[last_rollover_key] != dt.date.today():
-                results = TaskRolloverManager.process_daily_rollover(self.user_id, dt.date.today())
-                st.session_state[last_rollover_key] = dt.date.today()
+            if st.session_state[last_rollover_key] != today:
+                results = TaskRolloverManager.process_daily_rollover(self.user_id, today)
+                st.session_state[last_rollover_key] = today
                 
                 # Show rollover notification if tasks were rolled over
                 if results["rolled_over"] > 0:
@@ -339,7 +447,7 @@ class TodoInterface:
     
     def get_rollover_summary(self) -> dict:
         """Get rollover summary for this user"""
-        return TaskRolloverManager.get_rollover_insights(self.user_id)
+        return get_cached_rollover_insights(self.user_id)
 
 # ---------- Task Auto-Rollover System ----------
 class TaskRolloverHistory(Base):
@@ -351,8 +459,11 @@ class TaskRolloverHistory(Base):
     original_date = Column(Date, nullable=False)
     rolled_to_date = Column(Date, nullable=False)
     rollover_timestamp = Column(DateTime, default=dt.datetime.utcnow)
-    task = relationship("Task")
-    user = relationship("User")
+    # History rows are returned detached from get_rollover_history, so eager
+    # selectin loading keeps these usable after the session closes and batches
+    # the related fetch into one IN query instead of a lazy load per row.
+    task = relationship("Task", lazy="selectin")
+    user = relationship("User", lazy="selectin")
 
 class UserRolloverPreference(Base):
     """User preference settings for auto-rollover behavior"""
@@ -418,7 +529,7 @@ class TaskRolloverManager:
         try:
             with SessionLocal() as session:
                 # Get the task from this session
-                task_to_rollover = session.query(Task).get(task.id)
+                task_to_rollover = session.get(Task, task.id)
                 if not task_to_rollover:
                     return False
                 
@@ -463,8 +574,6 @@ class TaskRolloverManager:
             
             with SessionLocal() as session:
                 # Get incomplete tasks from previous days
-                previous_date = current_date - dt.timedelta(days=1)
-                
                 incomplete_tasks = session.query(Task).filter(
                     Task.user_id == user_id,
                     Task.due_date < current_date,
@@ -472,18 +581,49 @@ class TaskRolloverManager:
                     Task.scope == "daily",
                     Task.auto_rollover == True
                 ).all()
-                
-                for task in incomplete_tasks:
-                    results["processed"] += 1
-                    
-                    if TaskRolloverManager.should_rollover_task(task, user_preference):
-                        if TaskRolloverManager.rollover_task(task, current_date):
-                            results["rolled_over"] += 1
+
+                if incomplete_tasks:
+                    # One grouped query replaces a COUNT per candidate task
+                    rollover_counts = dict(
+                        session.query(
+                            TaskRolloverHistory.task_id,
+                            func.count(TaskRolloverHistory.id)
+                        ).filter(
+                            TaskRolloverHistory.task_id.in_([t.id for t in incomplete_tasks])
+                        ).group_by(TaskRolloverHistory.task_id).all()
+                    )
+
+                    eligible = []
+                    for task in incomplete_tasks:
+                        results["processed"] += 1
+                        if rollover_counts.get(task.id, 0) >= user_preference.max_rollover_days:
+                            results["skipped"] += 1
                         else:
-                            results["errors"] += 1
-                    else:
-                        results["skipped"] += 1
-                        
+                            eligible.append(task)
+
+                    if eligible:
+                        # Capture history rows before the bulk UPDATE rewrites due_date
+                        history_entries = [
+                            TaskRolloverHistory(
+                                task_id=t.id,
+                                user_id=t.user_id,
+                                original_date=t.due_date,
+                                rolled_to_date=current_date
+                            )
+                            for t in eligible
+                        ]
+                        session.execute(
+                            update(Task).where(
+                                Task.id.in_([t.id for t in eligible])
+                            ).values(
+                                due_date=current_date,
+                                updated_at=dt.datetime.utcnow()
+                            )
+                        )
+                        session.add_all(history_entries)
+                        session.commit()
+                        results["rolled_over"] = len(eligible)
+
         except Exception as e:
             print(f"Error processing daily rollover for user {user_id}: {e}")
             results["errors"] += 1
@@ -491,16 +631,17 @@ class TaskRolloverManager:
         return results
     
     @staticmethod
-    def get_rollover_history(user_id: int, days: int = 30) -> List[TaskRolloverHistory]:
-        """Get rollover history for a user"""
+    def get_rollover_history(user_id: int, days: int = 30,
+                             limit: int = 200) -> List[TaskRolloverHistory]:
+        """Get rollover history for a user, newest first, capped at `limit` rows"""
         with SessionLocal() as session:
             cutoff_date = dt.date.today() - dt.timedelta(days=days)
-            
+
             history = session.query(TaskRolloverHistory).filter(
                 TaskRolloverHistory.user_id == user_id,
                 TaskRolloverHistory.rollover_timestamp >= cutoff_date
-            ).order_by(TaskRolloverHistory.rollover_timestamp.desc()).all()
-            
+            ).order_by(TaskRolloverHistory.rollover_timestamp.desc()).limit(limit).all()
+
             return history
     
     @staticmethod
@@ -516,7 +657,6 @@ class TaskRolloverManager:
             ).count()
             
             # Get most frequently rolled over tasks
-            from sqlalchemy import func
             frequent_rollovers = session.query(
                 Task.title,
                 func.count(TaskRolloverHistory.id).label('rollover_count')
@@ -531,6 +671,16 @@ class TaskRolloverManager:
                 "rollover_enabled": TaskRolloverManager.get_user_rollover_preference(user_id).auto_rollover_enabled
             }
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_rollover_insights(user_id: int) -> dict:
+    """Render-path wrapper around rollover insights.
+
+    The insights aggregation runs a COUNT plus a GROUP BY on every Dashboard
+    render even when nothing changed; a short TTL keeps reruns cheap while
+    still picking up new rollovers within a minute.
+    """
+    return TaskRolloverManager.get_rollover_insights(user_id)
+
 def trigger_daily_rollover_check():
     """Trigger daily rollover check for all users"""
     try:
@@ -551,31 +701,174 @@ def trigger_daily_rollover_check():
         return {}
 
 # ---------- Helpers ----------
+@st.cache_data(ttl=300, show_spinner=False)
+def get_user_index() -> dict:
+    """Cached name -> id map for all users, shared by sidebar and views"""
+    with SessionLocal() as s:
+        return {name: uid for uid, name in s.query(User.id, User.name).order_by(User.name).all()}
+
+# Per-process cache of detached User rows; names never change once created,
+# and callers only read id/name, which stay loaded after the session closes.
+_USER_CACHE = {}
+
 def get_user_by_name(name: str) -> User:
+    u = _USER_CACHE.get(name)
+    if u is not None:
+        return u
     with SessionLocal() as s:
         u = s.query(User).filter(User.name == name).first()
         if not u:
             u = User(name=name)
             s.add(u); s.commit(); s.refresh(u)
+            get_user_index.clear()  # new user invalidates the cached map
+        _ = (u.id, u.name)  # make sure attributes are loaded before detaching
+        _USER_CACHE[name] = u
         return u
 
+@contextmanager
+def _session_scope(session=None):
+    """Yield the caller's session if given, otherwise open and close a fresh one.
+
+    Lets one rerun share a single session across several helper calls
+    instead of paying a connection checkout per call.
+    """
+    if session is not None:
+        yield session
+    else:
+        with SessionLocal() as s:
+            yield s
+
+def get_daily_task_stats(user_id: int, date: dt.date, session=None) -> Tuple[int, int]:
+    """Return (total, completed) daily-task counts for a user in one aggregate query"""
+    with _session_scope(session) as s:
+        total, done = s.query(
+            func.count(Task.id),
+            func.sum(case((Task.completed == True, 1), else_=0))
+        ).filter(
+            Task.user_id == user_id,
+            Task.scope == "daily",
+            Task.due_date == date
+        ).one()
+    return total or 0, int(done or 0)
+
+def get_week_snapshot(user_id: int, end_date: dt.date, session=None) -> "pd.DataFrame":
+    """Return a Date/Task/Status frame for the trailing week.
+
+    The status string is computed in SQL and the three columns feed the
+    DataFrame constructor directly, so no per-row dicts are allocated and
+    pandas skips dtype inference over objects.
+    """
+    # Deferred so reruns that never hit the dashboard skip the pandas import
+    import pandas as pd
+    start_date = end_date - dt.timedelta(days=6)
+    with _session_scope(session) as s:
+        rows = s.query(
+            Task.due_date,
+            Task.title,
+            case((Task.completed == True, "Done"), else_="Pending")
+        ).filter(
+            Task.user_id == user_id,
+            Task.scope == "daily",
+            Task.due_date >= start_date,
+            Task.due_date <= end_date
+        ).order_by(Task.due_date, Task.completed).all()
+    return pd.DataFrame(rows, columns=["Date", "Task", "Status"])
+
+def get_daily_task_stats_by_user(date: dt.date, session=None) -> dict:
+    """Return {user_id: (total, completed)} daily-task counts in one GROUP BY query"""
+    with _session_scope(session) as s:
+        rows = s.query(
+            Task.user_id,
+            func.count(Task.id),
+            func.sum(case((Task.completed == True, 1), else_=0))
+        ).filter(
+            Task.scope == "daily",
+            Task.due_date == date
+        ).group_by(Task.user_id).all()
+    return {uid: (total or 0, int(done or 0)) for uid, total, done in rows}
+
 def delete_row(model, row_id: int):
+    # One DELETE by primary key — no load, no unit-of-work cascade walk
     with SessionLocal() as s:
-        obj = s.query(model).get(row_id)
-        if obj:
-            s.delete(obj); s.commit()
-
-def quill_delta_to_text(delta_json: str) -> str:
+        if s.execute(delete(model).where(model.id == row_id)).rowcount:
+            s.commit()
+            get_cached_day_summary.clear()
+
+# Matches the string payload of "insert" ops in a raw Quill delta, with
+# escape sequences kept intact for a per-fragment JSON unescape
+_INSERT_RE = re.compile(r'"insert"\s*:\s*"((?:\\.|[^"\\])*)"')
+
+def note_content_hash(payload: str) -> str:
+    """Short content digest for DailyNote; lets save paths skip no-op writes"""
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+def quill_delta_to_text(delta_json: str, limit: Optional[int] = None) -> str:
+    if limit is not None:
+        # Stream insert strings straight out of the raw JSON and stop once
+        # `limit` chars are collected — O(limit) instead of O(note size)
+        out, total = [], 0
+        for m in _INSERT_RE.finditer(delta_json or ""):
+            try:
+                piece = _json_loads('"' + m.group(1) + '"')
+            except Exception:
+                continue
+            out.append(piece)
+            total += len(piece)
+            if total >= limit:
+                break
+        return "".join(out)[:limit]
     try:
-        ops = json.loads(delta_json or "{}").get("ops", [])
-        return "".join(op.get("insert","") for op in ops)
+        ops = _json_loads(delta_json or "{}").get("ops", [])
+        # List comprehension keeps join in one C-level pass; the isinstance
+        # guard also skips non-text embed ops instead of blowing up on them
+        return "".join([op["insert"] for op in ops if isinstance(op.get("insert"), str)])
     except Exception:
         return ""
 
 # --------- Summarizer (no LLM) ----------
 WEEKDAYS = {name.lower(): i for i, name in enumerate(calendar.day_name)}  # monday=0..sunday=6
-MONTHS = {name.lower(): i+1 for i, name in enumerate(calendar.month_name) if name}
-MONTHS.update({name.lower(): i+1 for i, name in enumerate(calendar.month_abbr) if name})
+_MONTH_NAMES = ("january", "february", "march", "april", "may", "june",
+                "july", "august", "september", "october", "november", "december")
+_MONTH_ABBR = ("jan", "feb", "mar", "apr", "may", "jun",
+               "jul", "aug", "sep", "oct", "nov", "dec")
+MONTHS = {n: i+1 for i, n in enumerate(_MONTH_NAMES)} | {n: i+1 for i, n in enumerate(_MONTH_ABBR)}
+
+# Compiled once at import so each parse is a direct Pattern.search with no
+# per-call cache probe
+_RELATIVE_WEEKDAY_RE = re.compile(r"\b(last|next)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b")
+_DATE_ISO_RE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b")
+_DATE_US_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+_DATE_MONTH_DAY_RE = re.compile(r"\b([A-Za-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?(?:,\s*(\d{4}))?\b")
+_DATE_DAY_MONTH_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})(?:\s+(\d{4}))?\b")
+
+def _numeric_date_token(tok: str) -> Optional[dt.date]:
+    """Hand-rolled scan for one ISO (YYYY-M-D) or US (M/D/YYYY) token.
+
+    Plain split/isdigit checks are far cheaper than a regex pass for the
+    overwhelmingly common case of a whitespace-delimited date. Returns None
+    for anything else — including out-of-range dates — so the regex
+    fallback still gets its chance.
+    """
+    if "-" in tok:
+        parts = tok.split("-")
+        if len(parts) == 3 and len(parts[0]) == 4 and all(p.isdigit() for p in parts):
+            try:
+                return dt.date(int(parts[0]), int(parts[1]), int(parts[2]))
+            except ValueError:
+                return None
+    elif "/" in tok:
+        parts = tok.split("/")
+        if len(parts) == 3 and len(parts[2]) == 4 and all(p.isdigit() for p in parts):
+            try:
+                return dt.date(int(parts[2]), int(parts[0]), int(parts[1]))
+            except ValueError:
+                return None
+    return None
+
+@lru_cache(maxsize=256)
+def _fmt_long_date(d: dt.date) -> str:
+    """Memoized long-form date; strftime's locale machinery runs once per date"""
+    return d.strftime('%A, %B %d, %Y')
 
 def parse_human_date(q: str, today: dt.date) -> Optional[dt.date]:
     ql = q.lower()
@@ -584,7 +877,7 @@ def parse_human_date(q: str, today: dt.date) -> Optional[dt.date]:
     if "yesterday" in ql: return today - dt.timedelta(days=1)
     if "tomorrow" in ql: return today + dt.timedelta(days=1)
 
-    m = re.search(r"\b(last|next)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", ql)
+    m = _RELATIVE_WEEKDAY_RE.search(ql)
     if m:
         direction, wd = m.group(1), m.group(2)
         target = WEEKDAYS[wd]
@@ -596,18 +889,31 @@ def parse_human_date(q: str, today: dt.date) -> Optional[dt.date]:
             delta = 7 if delta == 0 else delta
             return today - dt.timedelta(days=delta)
 
-    m = re.search(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b", ql)
+    # Every remaining format carries a day number, so a query without a
+    # single digit can skip all four date regexes
+    if not any(c.isdigit() for c in ql):
+        return None
+
+    # Token fast path: numeric dates in textual order, with the regexes
+    # below kept as fallback for forms the whitespace split misses
+    # (e.g. "on2025-04-07")
+    for tok in ql.split():
+        d_tok = _numeric_date_token(tok.strip(".,!?;:()"))
+        if d_tok:
+            return d_tok
+
+    m = _DATE_ISO_RE.search(ql)
     if m:
         y, mo, d = map(int, m.groups())
         try: return dt.date(y, mo, d)
         except: pass
-    m = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b", ql)
+    m = _DATE_US_RE.search(ql)
     if m:
         mo, d, y = map(int, m.groups())
         try: return dt.date(y, mo, d)
         except: pass
 
-    m = re.search(r"\b([A-Za-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?(?:,\s*(\d{4}))?\b", q)
+    m = _DATE_MONTH_DAY_RE.search(q)
     if m:
         mon_name, day_str, year_str = m.groups()
         mo = MONTHS.get(mon_name.lower())
@@ -617,7 +923,7 @@ def parse_human_date(q: str, today: dt.date) -> Optional[dt.date]:
             try: return dt.date(year, mo, day)
             except: pass
 
-    m = re.search(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})(?:\s+(\d{4}))?\b", q)
+    m = _DATE_DAY_MONTH_RE.search(q)
     if m:
         day_str, mon_name, year_str = m.groups()
         mo = MONTHS.get(mon_name.lower())
@@ -629,43 +935,82 @@ def parse_human_date(q: str, today: dt.date) -> Optional[dt.date]:
 
     return None
 
+# Compiled once: a named-user scan and a we/both detector, replacing the
+# per-call substring loops. Names keep priority over pronouns.
+_SUBJECT_NAME_RE = re.compile(r"\b(" + "|".join(re.escape(u.lower()) for u in DEFAULT_USERS) + r")\b")
+# "us" deliberately excluded: it false-positives on queries like
+# "what did I do in the US?"
+_SUBJECT_BOTH_RE = re.compile(r"\b(?:we|both|together)\b")
+
 def detect_subject(q: str, default_user: str) -> Tuple[str, List[str]]:
     ql = q.lower()
-    for name in DEFAULT_USERS:
-        if name.lower() in ql:
-            return "single", [name]
-    if " my " in f" {ql} " or ql.startswith("what did i"):
-        return "single", [default_user]
+    m = _SUBJECT_NAME_RE.search(ql)
+    if m:
+        return "single", [m.group(1).title()]
+    if _SUBJECT_BOTH_RE.search(ql):
+        return "both", list(DEFAULT_USERS)
     # default: active user
     return "single", [default_user]
 
 def summarize_day_for_users(date: dt.date, names: List[str]) -> str:
-    lines = [f"### {date.strftime('%A, %B %d, %Y')}"]
+    lines = [f"### {_fmt_long_date(date)}"]
     with SessionLocal() as s:
+        users_by_name = {u.name: u for u in s.query(User).filter(User.name.in_(names)).all()}
+        ids = [u.id for u in users_by_name.values()]
+        # Batch the notes and tasks for every requested user into one IN
+        # query each, instead of two queries per name
+        notes_by_user = {
+            dn.user_id: dn
+            for dn in s.query(DailyNote).filter(DailyNote.user_id.in_(ids),
+                                                DailyNote.date==date).all()
+        }
+        tasks_by_user = {}
+        # Only user_id/title/completed are rendered, so skip hydrating full Task rows
+        for uid, title, completed in s.query(Task.user_id, Task.title, Task.completed)\
+                .filter(Task.user_id.in_(ids), Task.scope=="daily", Task.due_date==date)\
+                .order_by(Task.completed.asc(), Task.created_at.desc()).all():
+            tasks_by_user.setdefault(uid, []).append((title, completed))
         for nm in names:
-            u = s.query(User).filter(User.name==nm).first()
+            u = users_by_name.get(nm)
             if not u:
                 lines.append(f"- {nm}: no profile found."); continue
-            dn = s.query(DailyNote).filter(DailyNote.user_id==u.id, DailyNote.date==date).first()
-            note_text = quill_delta_to_text(dn.content_json)[:800].strip() if dn else ""
-            tasks = s.query(Task).filter(Task.user_id==u.id, Task.scope=="daily", Task.due_date==date)\
-                                 .order_by(Task.completed.asc(), Task.created_at.desc()).all()
+            dn = notes_by_user.get(u.id)
+            note_text = get_cached_note_text(dn.id, dn.updated_at, dn.content_json, 800).strip() if dn else ""
+            tasks = tasks_by_user.get(u.id, [])
             lines.append(f"**{nm}**")
             lines.append(f"- 📝 {note_text if note_text else '(no note)'}")
             if tasks:
-                for t in tasks[:20]:
-                    lines.append(f"- {'✅' if t.completed else '•'} {t.title}")
+                for title, completed in tasks[:20]:
+                    lines.append(f"- {'✅' if completed else '•'} {title}")
             else:
                 lines.append("- (no tasks)")
             lines.append("")  # spacer
     return "\n".join(lines).strip()
 
+@st.cache_data(max_entries=512, show_spinner=False)
+def get_cached_note_text(note_id: int, updated_at: dt.datetime,
+                         delta_json: str, limit: int) -> str:
+    """Memoized note-text extraction keyed by (id, updated_at).
+
+    Unchanged notes skip the delta scan entirely on repeat summaries.
+    """
+    return quill_delta_to_text(delta_json, limit=limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_day_summary(date: dt.date, names: Tuple[str, ...]) -> str:
+    """Short-TTL cache over summarize_day_for_users for repeat questions.
+
+    Keyed on a tuple of names for hashability; task mutations clear it so
+    answers never lag behind an edit.
+    """
+    return summarize_day_for_users(date, list(names))
+
 def ask_bluenest_summarizer(question: str, default_user: str) -> str:
     today = dt.date.today()
     mode, targets = detect_subject(question, default_user)
     d = parse_human_date(question, today)
     if d:
-        return summarize_day_for_users(d, targets)
+        return get_cached_day_summary(d, tuple(targets))
     # gentle help
     return ("Try things like:\n"
             "- “what did I do on April 10?”\n"
@@ -867,10 +1212,13 @@ st.set_page_config(page_title="BlueNest", page_icon="💙", layout="wide")
 # Dynamic background with daily themes and smooth animations
 today = dt.date.today()
 current_theme = get_daily_background_theme(today)
-background_css = get_background_css(current_theme)
 
-# Create CSS with dynamic background
-css_content = """
+@st.cache_data(show_spinner=False)
+def build_app_css(theme: str) -> str:
+    """Assemble the app-wide CSS for a theme, cached so the big string is
+    only built once per theme instead of on every rerun."""
+    background_css = get_background_css(theme)
+    css_content = """
 <style>
 @keyframes backgroundShift {
     0%, 100% { filter: hue-rotate(0deg) brightness(1); }
@@ -889,7 +1237,7 @@ html, body, [data-testid="stAppViewContainer"] {
   transition: all 0.8s ease-in-out;
 }"""
 
-css_content += """
+    css_content += """
 .block-container { 
   padding-top: 0.8rem; 
   padding-bottom: 1.6rem;
@@ -905,7 +1253,7 @@ h1, h2, h3 {
   transition: opacity 0.3s ease;
 }"""
 
-css_content += """
+    css_content += """
 
 /* Navigation Enhancements */
 .stRadio > div {
@@ -1096,7 +1444,7 @@ css_content += """
   transition: all 0.3s ease;
 }"""
 
-css_content += """
+    css_content += """
 
 .right-sticky { 
   position: sticky; 
@@ -1206,8 +1554,9 @@ css_content += """
 }
 </style>
 """
+    return css_content
 
-st.markdown(css_content, unsafe_allow_html=True)
+st.markdown(build_app_css(current_theme), unsafe_allow_html=True)
 
 # Add swipe navigation JavaScript (will be called in todo view)
 # st.markdown(get_swipe_navigation_js(), unsafe_allow_html=True)
@@ -1221,13 +1570,12 @@ with st.sidebar:
     st.caption("Navigate your productivity space")
 
     # ensure Ravi & Amitha exist
-    with SessionLocal() as s:
-        user_names = [u.name for u in s.query(User).order_by(User.name).all()]
-    for required in DEFAULT_USERS:
-        if required not in user_names:
-            get_user_by_name(required)
-    with SessionLocal() as s:
-        user_names = [u.name for u in s.query(User).order_by(User.name).all()]
+    user_names = list(get_user_index())
+    if any(required not in user_names for required in DEFAULT_USERS):
+        for required in DEFAULT_USERS:
+            if required not in user_names:
+                get_user_by_name(required)
+        user_names = list(get_user_index())
 
     # Active User Selector (including Common)
     st.markdown("#### Active User")
@@ -1347,7 +1695,7 @@ view_titles = {
 
 current_title = view_titles.get(nav_state.current_view, APP_TITLE)
 st.markdown(f"## {current_title}")
-st.caption(today.strftime('%A, %B %d, %Y'))
+st.caption(_fmt_long_date(today))
 
 # ---------- Context-sensitive Layout ----------
 if nav_state.current_view == "todo":
@@ -1371,7 +1719,12 @@ with right:
         st.markdown("</div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
-    if st.session_state.show_blue:
+    # Fragment-scoped so chat keystrokes only rerun the chatbox, not the
+    # task/notebook query stack
+    @st.fragment
+    def render_blue_chat():
+        if not st.session_state.show_blue:
+            return
         st.markdown("<div class='chatbox'>", unsafe_allow_html=True)
         st.markdown("**Hey! It's Blue boy!!**  \n*what do you want to know from me?*")
         default_user = persona
@@ -1382,26 +1735,33 @@ with right:
             st.markdown(ans.replace("\n","  \n"))
         if st.button("Close", key="blue_close", use_container_width=True):
             st.session_state.show_blue = False
-            st.rerun()
+            st.rerun(scope="fragment")
         st.markdown("</div>", unsafe_allow_html=True)
 
-    # Notebook tab ONLY here (not in the To-Do window)
-    tabs = st.tabs(["Notebook"])
-    with tabs[0]:
+    render_blue_chat()
+
+    # Notebook tab ONLY here (not in the To-Do window).
+    # Fragment-scoped so note edits/saves stay inside this panel.
+    @st.fragment
+    def render_notebook_panel():
         current_user = get_user_by_name(persona)
         date_key = f"todo_date_{current_user.id}"
         if date_key not in st.session_state:
             st.session_state[date_key] = today
         note_date = st.session_state[date_key]
 
-        # ensure note exists
+        # ensure note exists: one INSERT .. ON CONFLICT DO NOTHING against
+        # the unique (user_id, date) index replaces the select-then-insert
+        # round trip and is race-free when both users open the same day
         with SessionLocal() as s:
+            empty_json = _json_dumps({"ops":[{"insert":"\n"}]})
+            s.execute(sqlite_insert(DailyNote).values(
+                user_id=current_user.id, date=note_date,
+                content_json=empty_json, content_hash=note_content_hash(empty_json),
+            ).on_conflict_do_nothing(index_elements=["user_id", "date"]))
+            s.commit()
             dn = s.query(DailyNote).filter(DailyNote.user_id==current_user.id,
                                            DailyNote.date==note_date).first()
-            if not dn:
-                dn = DailyNote(user_id=current_user.id, date=note_date,
-                               content_json=json.dumps({"ops":[{"insert":"\n"}]}))
-                s.add(dn); s.commit(); s.refresh(dn)
 
         st.caption(f"{current_user.name} — {note_date.strftime('%a, %b %d, %Y')}")
         if st_quill is None:
@@ -1412,27 +1772,47 @@ with right:
                                height=200)
             # No big success boxes; just a quiet save
             if st.button("Save", key=f"save_note_{current_user.id}"):
-                with SessionLocal() as s:
-                    nn = s.query(DailyNote).get(dn.id)
-                    nn.content_json = json.dumps({"ops":[{"insert": raw + "\n"}]})
-                    nn.updated_at = dt.datetime.utcnow()
-                    s.commit()
+                payload = _json_dumps({"ops":[{"insert": raw + "\n"}]})
+                h = note_content_hash(payload)
+                if h != dn.content_hash:  # skip the write when nothing changed
+                    with SessionLocal() as s:
+                        s.execute(update(DailyNote).where(DailyNote.id == dn.id).values(
+                            content_json=payload, content_hash=h,
+                            updated_at=dt.datetime.utcnow()
+                        ))
+                        s.commit()
+                    get_cached_day_summary.clear()
                 st.caption("Saved")  # subtle
         else:
-            try:
-                content_dict = json.loads(dn.content_json or "{}")
-            except Exception:
-                content_dict = {"ops":[{"insert":"\n"}]}
+            # Re-parse the delta only when the note actually changed;
+            # keystroke-triggered reruns reuse the parsed dict
+            note_key = (dn.id, dn.updated_at)
+            if st.session_state.get("_note_key") != note_key:
+                try:
+                    st.session_state["_note_dict"] = _json_loads(dn.content_json or "{}")
+                except Exception:
+                    st.session_state["_note_dict"] = {"ops":[{"insert":"\n"}]}
+                st.session_state["_note_key"] = note_key
+            content_dict = st.session_state["_note_dict"]
             result = st_quill(value=content_dict, placeholder="Write your note…",
                               key=f"quill_{dn.id}", html=False, toolbar=True)
             if st.button("Save", key=f"save_quill_{current_user.id}"):
-                with SessionLocal() as s:
-                    nn = s.query(DailyNote).get(dn.id)
-                    nn.content_json = json.dumps(result or {"ops":[{"insert":"\n"}]})
-                    nn.updated_at = dt.datetime.utcnow()
-                    s.commit()
+                payload = _json_dumps(result or {"ops":[{"insert":"\n"}]})
+                h = note_content_hash(payload)
+                if h != dn.content_hash:  # skip the write when nothing changed
+                    with SessionLocal() as s:
+                        s.execute(update(DailyNote).where(DailyNote.id == dn.id).values(
+                            content_json=payload, content_hash=h,
+                            updated_at=dt.datetime.utcnow()
+                        ))
+                        s.commit()
+                    get_cached_day_summary.clear()
                 st.caption("Saved")  # subtle
 
+    tabs = st.tabs(["Notebook"])
+    with tabs[0]:
+        render_notebook_panel()
+
 # Show right panel only for to-do view
 if nav_state.current_view == "todo":
     pass  # Right panel already handled above in the to-do view section
@@ -1450,7 +1830,10 @@ else:
             st.markdown("</div>", unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
-        if st.session_state.show_blue:
+        @st.fragment
+        def render_blue_chat_alt():
+            if not st.session_state.show_blue:
+                return
             st.markdown("<div class='chatbox'>", unsafe_allow_html=True)
             st.markdown("**Hey! It's Blue boy!!**  \n*what do you want to know from me?*")
             default_user = persona
@@ -1461,9 +1844,11 @@ else:
                 st.markdown(ans.replace("\n","  \n"))
             if st.button("Close", key="blue_close_alt", use_container_width=True):
                 st.session_state.show_blue = False
-                st.rerun()
+                st.rerun(scope="fragment")
             st.markdown("</div>", unsafe_allow_html=True)
 
+        render_blue_chat_alt()
+
 st.markdown("</div>", unsafe_allow_html=True)  # Close main-content
 
 # ========== MAIN CONTENT AREA - Context Sensitive ==========
@@ -1471,7 +1856,11 @@ st.markdown("<div class='main-content'>", unsafe_allow_html=True)
 
 if nav_state.current_view == "todo":
     # ========== TO-DO VIEW ==========
-    with left:
+    # Fragment-scoped so task toggles/edits only re-execute this panel
+    # instead of re-running every query in the script. Date navigation still
+    # triggers a full rerun because the Notebook panel shares the date key.
+    @st.fragment
+    def render_todo_panel():
         user = get_user_by_name(persona)
 
         # Enhanced date state + controls with swipe navigation
@@ -1542,6 +1931,9 @@ if nav_state.current_view == "todo":
         todo_interface.render_task_input()
         todo_interface.render_task_list()
 
+    with left:
+        render_todo_panel()
+
 elif nav_state.current_view == "dashboard":
     # ========== DASHBOARD VIEW ==========
     with left:
@@ -1550,11 +1942,13 @@ elif nav_state.current_view == "dashboard":
         if nav_state.active_user == "Common":
             st.markdown("#### Shared Insights")
             st.info("Dashboard showing combined insights for all users")
-            
-            # Placeholder for shared dashboard content
+
+            stats_by_user = get_daily_task_stats_by_user(today)
+            combined_total = sum(t for t, _ in stats_by_user.values())
+            combined_done = sum(d for _, d in stats_by_user.values())
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Total Tasks This Week", "42", "↑ 12%")
+                st.metric("Tasks Today (All Users)", f"{combined_done}/{combined_total}")
                 st.metric("Vision Board Items", "8", "↑ 2")
             with col2:
                 st.metric("Completed Goals", "3", "↑ 1")
@@ -1562,16 +1956,24 @@ elif nav_state.current_view == "dashboard":
         else:
             st.markdown(f"#### {nav_state.active_user}'s Insights")
             st.info(f"Personal dashboard for {nav_state.active_user}")
-            
-            # Placeholder for personal dashboard content
+
+            dash_user = get_user_by_name(nav_state.active_user)
+            # One session shared by every dashboard query on this rerun
+            with SessionLocal() as dash_s:
+                total_today, done_today = get_daily_task_stats(dash_user.id, today, session=dash_s)
+                week_df = get_week_snapshot(dash_user.id, today, session=dash_s)
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Tasks Completed Today", "5", "↑ 2")
+                st.metric("Tasks Completed Today", f"{done_today}/{total_today}")
                 st.metric("Weekly Completion Rate", "78%", "↑ 5%")
             with col2:
                 st.metric("Current Streak", "7 days", "↑ 1")
                 st.metric("Monthly Goals", "2/5", "→ 0")
 
+            if not week_df.empty:
+                st.markdown("#### This Week")
+                st.dataframe(week_df, hide_index=True, use_container_width=True)
+
 elif nav_state.current_view == "wishlist":
     # ========== WISHLIST VIEW ==========
     with left:
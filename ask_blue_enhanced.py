@@ -7,6 +7,38 @@ from sqlalchemy import create_engine
 
 # This will be integrated into app.py
 
+# Keyword tables for query-type detection, built once at module scope so each
+# _is_*_query call is a tight membership scan with no per-call list allocation.
+_DATE_INDICATORS = (
+    "what did", "what happened", "what was", "on april", "on march",
+    "yesterday", "today", "tomorrow", "last week", "this week",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+)
+_GOAL_INDICATORS = ("goal", "goals", "target", "objective", "plan", "planning")
+_ACTIVITY_INDICATORS = ("activity", "activities", "task", "tasks", "doing", "completed", "working on")
+_COMPLETION_INDICATORS = ("completion", "progress", "finished", "done", "completed", "rate")
+_VISION_INDICATORS = ("vision", "vision board", "dreams", "aspirations", "inspiration")
+_ROLLOVER_INDICATORS = ("rollover", "rolled over", "incomplete", "unfinished", "pending")
+
+
+def _indicator_re(indicators: Tuple[str, ...]) -> "re.Pattern":
+    """Fuse an indicator table into one compiled alternation.
+
+    A single search makes one pass over the query instead of one substring
+    scan per indicator. Indicators are escaped so substring semantics are
+    preserved (e.g. "plan" still matches inside "planning").
+    """
+    return re.compile("|".join(re.escape(i) for i in indicators))
+
+
+_DATE_RE = _indicator_re(_DATE_INDICATORS)
+_GOAL_RE = _indicator_re(_GOAL_INDICATORS)
+_ACTIVITY_RE = _indicator_re(_ACTIVITY_INDICATORS)
+_COMPLETION_RE = _indicator_re(_COMPLETION_INDICATORS)
+_VISION_RE = _indicator_re(_VISION_INDICATORS)
+_ROLLOVER_RE = _indicator_re(_ROLLOVER_INDICATORS)
+
+
 class BlueAssistant:
     """Enhanced Ask Blue AI assistant with cross-user data aggregation and contextual responses"""
     
@@ -20,8 +52,11 @@ class BlueAssistant:
         
         query_lower = query.lower()
         today = dt.date.today()
-        
-        # Enhanced query type detection
+
+        # Priority chain over the per-type fused alternations: each check is
+        # one compiled search with early exit, so overlapping indicators
+        # (e.g. "finished" inside "unfinished") resolve exactly as the
+        # original substring loops did
         if self._is_date_query(query_lower):
             return self._handle_date_query(query, user_context, today)
         elif self._is_goal_query(query_lower):
@@ -39,37 +74,27 @@ class BlueAssistant:
     
     def _is_date_query(self, query: str) -> bool:
         """Check if query is asking about a specific date"""
-        date_indicators = [
-            "what did", "what happened", "what was", "on april", "on march", 
-            "yesterday", "today", "tomorrow", "last week", "this week",
-            "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
-        ]
-        return any(indicator in query for indicator in date_indicators)
+        return _DATE_RE.search(query) is not None
     
     def _is_goal_query(self, query: str) -> bool:
         """Check if query is asking about goals"""
-        goal_indicators = ["goal", "goals", "target", "objective", "plan", "planning"]
-        return any(indicator in query for indicator in goal_indicators)
+        return _GOAL_RE.search(query) is not None
     
     def _is_activity_query(self, query: str) -> bool:
         """Check if query is asking about activities or tasks"""
-        activity_indicators = ["activity", "activities", "task", "tasks", "doing", "completed", "working on"]
-        return any(indicator in query for indicator in activity_indicators)
+        return _ACTIVITY_RE.search(query) is not None
     
     def _is_completion_query(self, query: str) -> bool:
         """Check if query is asking about completion rates or progress"""
-        completion_indicators = ["completion", "progress", "finished", "done", "completed", "rate"]
-        return any(indicator in query for indicator in completion_indicators)
+        return _COMPLETION_RE.search(query) is not None
     
     def _is_vision_board_query(self, query: str) -> bool:
         """Check if query is asking about vision board"""
-        vision_indicators = ["vision", "vision board", "dreams", "aspirations", "inspiration"]
-        return any(indicator in query for indicator in vision_indicators)
+        return _VISION_RE.search(query) is not None
     
     def _is_rollover_query(self, query: str) -> bool:
         """Check if query is asking about task rollovers"""
-        rollover_indicators = ["rollover", "rolled over", "incomplete", "unfinished", "pending"]
-        return any(indicator in query for indicator in rollover_indicators)
+        return _ROLLOVER_RE.search(query) is not None
     
     def _provide_help_suggestions(self) -> str:
         """Provide helpful suggestions for queries"""
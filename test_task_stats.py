@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for dashboard task statistics helpers.
+Tests the single-query aggregate used by the personal dashboard.
+"""
+
+import pytest
+import datetime as dt
+import tempfile
+import os
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import Base, User, Task, get_daily_task_stats, get_daily_task_stats_by_user
+
+
+class TestTaskStats:
+    """Test suite for task statistics aggregation"""
+
+    @pytest.fixture
+    def db_session(self):
+        """Create a temporary database for testing"""
+        db_fd, db_path = tempfile.mkstemp()
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+
+        Base.metadata.create_all(engine)
+
+        SessionLocal = sessionmaker(bind=engine)
+        session = SessionLocal()
+
+        yield session
+
+        session.close()
+        os.close(db_fd)
+        os.unlink(db_path)
+
+    @pytest.fixture
+    def sample_user(self, db_session):
+        """Create a sample user for testing"""
+        user = User(name="TestUser")
+        db_session.add(user)
+        db_session.commit()
+        db_session.refresh(user)
+        return user
+
+    def test_stats_empty_day(self, db_session, sample_user):
+        """Test stats for a day with no tasks"""
+        with pytest.MonkeyPatch().context() as m:
+            def mock_session_local():
+                return db_session
+            m.setattr("app.SessionLocal", mock_session_local)
+
+            total, done = get_daily_task_stats(sample_user.id, dt.date(2024, 1, 15))
+
+            assert total == 0
+            assert done == 0
+
+    def test_stats_counts_completed_and_total(self, db_session, sample_user):
+        """Test that totals and completed counts come back from one query"""
+        test_date = dt.date(2024, 1, 15)
+        for i, completed in enumerate([True, True, False]):
+            db_session.add(Task(
+                user_id=sample_user.id,
+                title=f"Task {i}",
+                scope="daily",
+                due_date=test_date,
+                completed=completed
+            ))
+        db_session.commit()
+
+        with pytest.MonkeyPatch().context() as m:
+            def mock_session_local():
+                return db_session
+            m.setattr("app.SessionLocal", mock_session_local)
+
+            total, done = get_daily_task_stats(sample_user.id, test_date)
+
+            assert total == 3
+            assert done == 2
+
+    def test_stats_excludes_other_dates_and_scopes(self, db_session, sample_user):
+        """Test that other dates and non-daily scopes are not counted"""
+        test_date = dt.date(2024, 1, 15)
+        db_session.add(Task(
+            user_id=sample_user.id, title="Daily today", scope="daily",
+            due_date=test_date, completed=True
+        ))
+        db_session.add(Task(
+            user_id=sample_user.id, title="Daily yesterday", scope="daily",
+            due_date=test_date - dt.timedelta(days=1), completed=True
+        ))
+        db_session.add(Task(
+            user_id=sample_user.id, title="Yearly goal", scope="year",
+            due_date=test_date, completed=False
+        ))
+        db_session.commit()
+
+        with pytest.MonkeyPatch().context() as m:
+            def mock_session_local():
+                return db_session
+            m.setattr("app.SessionLocal", mock_session_local)
+
+            total, done = get_daily_task_stats(sample_user.id, test_date)
+
+            assert total == 1
+            assert done == 1
+
+    def test_stats_by_user_groups_all_users(self, db_session, sample_user):
+        """Test the GROUP BY aggregate returns per-user counts for all users"""
+        other_user = User(name="OtherUser")
+        db_session.add(other_user)
+        db_session.commit()
+        db_session.refresh(other_user)
+
+        sample_id, other_id = sample_user.id, other_user.id
+        test_date = dt.date(2024, 1, 15)
+        db_session.add(Task(
+            user_id=sample_id, title="Mine done", scope="daily",
+            due_date=test_date, completed=True
+        ))
+        db_session.add(Task(
+            user_id=sample_id, title="Mine pending", scope="daily",
+            due_date=test_date, completed=False
+        ))
+        db_session.add(Task(
+            user_id=other_id, title="Theirs pending", scope="daily",
+            due_date=test_date, completed=False
+        ))
+        db_session.commit()
+
+        with pytest.MonkeyPatch().context() as m:
+            def mock_session_local():
+                return db_session
+            m.setattr("app.SessionLocal", mock_session_local)
+
+            stats = get_daily_task_stats_by_user(test_date)
+
+            assert stats[sample_id] == (2, 1)
+            assert stats[other_id] == (1, 0)
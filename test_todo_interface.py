@@ -376,40 +376,48 @@ class TestTaskItemRendering(TestTodoInterface):
 class TestTaskOperations(TestTodoInterface):
     """Test task operations (toggle, update, delete)"""
     
-    @patch('app.SessionLocal')
-    def test_toggle_task_completion(self, mock_session_local, todo_interface):
-        """Test toggling task completion status"""
-        # Setup mock session and task
-        mock_session = Mock()
-        mock_session_local.return_value.__enter__.return_value = mock_session
-        
-        mock_task = Mock()
-        mock_task.completed = False
-        mock_session.query.return_value.get.return_value = mock_task
-        
-        # Test toggling to completed
-        todo_interface._toggle_task_completion(1, True)
-        
-        assert mock_task.completed is True
-        mock_session.commit.assert_called_once()
-    
-    @patch('app.SessionLocal')
-    def test_update_task_title(self, mock_session_local, todo_interface):
-        """Test updating task title"""
-        # Setup mock session and task
-        mock_session = Mock()
-        mock_session_local.return_value.__enter__.return_value = mock_session
-        
-        mock_task = Mock()
-        mock_task.title = "Old Title"
-        mock_session.query.return_value.get.return_value = mock_task
-        
-        # Test updating title
-        new_title = "New Title"
-        todo_interface._update_task_title(1, new_title)
-        
-        assert mock_task.title == new_title
-        mock_session.commit.assert_called_once()
+    def test_toggle_task_completion(self, todo_interface, db_session, sample_user):
+        """Test toggling task completion status via single UPDATE"""
+        task = Task(
+            user_id=sample_user.id,
+            title="Toggle Me",
+            scope="daily",
+            due_date=todo_interface.date,
+            completed=False
+        )
+        db_session.add(task)
+        db_session.commit()
+        db_session.refresh(task)
+
+        with patch('app.SessionLocal') as mock_session_local:
+            mock_session_local.return_value.__enter__.return_value = db_session
+
+            # Test toggling to completed
+            todo_interface._toggle_task_completion(task.id, True)
+
+        db_session.expire_all()
+        assert db_session.query(Task).filter(Task.id == task.id).one().completed is True
+
+    def test_update_task_title(self, todo_interface, db_session, sample_user):
+        """Test updating task title via single UPDATE"""
+        task = Task(
+            user_id=sample_user.id,
+            title="Old Title",
+            scope="daily",
+            due_date=todo_interface.date
+        )
+        db_session.add(task)
+        db_session.commit()
+        db_session.refresh(task)
+
+        with patch('app.SessionLocal') as mock_session_local:
+            mock_session_local.return_value.__enter__.return_value = db_session
+
+            # Test updating title
+            todo_interface._update_task_title(task.id, "New Title")
+
+        db_session.expire_all()
+        assert db_session.query(Task).filter(Task.id == task.id).one().title == "New Title"
     
     @patch('app.SessionLocal')
     def test_delete_task(self, mock_session_local, todo_interface):
@@ -419,8 +427,8 @@ class TestTaskOperations(TestTodoInterface):
         mock_session_local.return_value.__enter__.return_value = mock_session
         
         mock_task = Mock()
-        mock_session.query.return_value.get.return_value = mock_task
-        
+        mock_session.get.return_value = mock_task
+
         # Test deleting task
         todo_interface._delete_task(1)
         
@@ -428,20 +436,17 @@ class TestTaskOperations(TestTodoInterface):
         mock_session.commit.assert_called_once()
     
     @patch('app.SessionLocal')
-    def test_operations_with_nonexistent_task(self, mock_session_local, todo_interface):
+    def test_operations_with_nonexistent_task(self, mock_session_local, todo_interface, db_session):
         """Test operations gracefully handle nonexistent tasks"""
-        # Setup mock session with no task found
-        mock_session = Mock()
-        mock_session_local.return_value.__enter__.return_value = mock_session
-        mock_session.query.return_value.get.return_value = None
-        
+        mock_session_local.return_value.__enter__.return_value = db_session
+
         # Test operations don't crash with nonexistent task
         todo_interface._toggle_task_completion(999, True)
         todo_interface._update_task_title(999, "New Title")
         todo_interface._delete_task(999)
-        
-        # Verify no commits were made
-        mock_session.commit.assert_not_called()
+
+        # Verify nothing was created as a side effect
+        assert db_session.query(Task).count() == 0
 
 
 class TestIntegration(TestTodoInterface):